@@ -35,12 +35,20 @@ class StandXAuth:
         # JWT token (obtained after authentication)
         self._token: Optional[str] = None
         self._token_expires_at: float = 0
+        
+        # Static part of authenticated headers, rebuilt only when the token changes
+        self._build_token_headers()
     
     @property
     def token(self) -> Optional[str]:
         """Get current JWT token."""
         return self._token
     
+    @property
+    def bearer_headers(self) -> dict:
+        """Plain bearer-token headers for api.standx.com endpoints (do not mutate)."""
+        return self._bearer_headers
+    
     @property
     def is_authenticated(self) -> bool:
         """Check if we have a valid token."""
@@ -75,6 +83,7 @@ class StandXAuth:
             self._token = login_response["token"]
             # Token expires in 7 days by default
             self._token_expires_at = time.time() + 7 * 24 * 60 * 60
+            self._build_token_headers()
             
             return self._token
     
@@ -109,14 +118,22 @@ class StandXAuth:
     
     def get_auth_headers(self, payload: str = "") -> dict:
         """Get all headers needed for authenticated requests."""
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self._token}",
-        }
+        headers = self._base_headers.copy()
         if payload:
             headers.update(self.sign_request(payload))
         return headers
     
+    def _build_token_headers(self):
+        """Rebuild the token-derived header templates."""
+        self._base_headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self._token}",
+        }
+        self._bearer_headers = {
+            "Authorization": f"Bearer {self._token}",
+            "Accept": "application/json",
+        }
+    
     async def _prepare_sign_in(self, client: httpx.AsyncClient, chain: str, address: str) -> str:
         """Request signature data from server."""
         url = f"{self.BASE_URL}/v1/offchain/prepare-signin?chain={chain}"
@@ -41,7 +41,11 @@ class StandXHTTPClient:
     
     def __init__(self, auth: StandXAuth, latency_log_file: str = None):
         self._auth = auth
-        self._client = httpx.AsyncClient(timeout=30.0)
+        self._client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
         self._latency_log_file = latency_log_file
     
     def set_latency_log_file(self, filepath: str):
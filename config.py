@@ -4,13 +4,17 @@ from pathlib import Path
 from dataclasses import dataclass
 
 
-@dataclass
+# Prefer the libyaml-backed loader when available, same semantics as SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@dataclass(slots=True, frozen=True)
 class WalletConfig:
     chain: str
     private_key: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     wallet: WalletConfig
     symbol: str
@@ -45,7 +49,7 @@ def load_config(path: str = "config.yaml") -> Config:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
     
-    with open(config_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    with open(config_path, "rb") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
     
     return Config.from_dict(data)
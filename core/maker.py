@@ -4,13 +4,16 @@ Event-driven design:
 - Price updates trigger order checks
 - Order placement runs when conditions are met
 """
-import uuid
+import os
+import math
+import secrets
 import logging
 import asyncio
 import time
+from datetime import datetime
 from typing import Optional
 
-import requests
+import httpx
 
 from config import Config
 from api.http_client import StandXHTTPClient
@@ -19,47 +22,90 @@ from core.state import State, OpenOrder
 
 logger = logging.getLogger(__name__)
 
+_now = datetime.now
 
-def send_notify(title: str, message: str, priority: str = "normal"):
+# Reused across notifications so repeated alerts keep the connection alive
+_notify_client: Optional[httpx.AsyncClient] = None
+
+
+async def send_notify(title: str, message: str, priority: str = "normal"):
     """Send notification via Telegram.
     
     Requires environment variables:
         NOTIFY_URL: Notification service URL
         NOTIFY_API_KEY: API key for the notification service
     """
-    import os
     notify_url = os.environ.get("NOTIFY_URL", "")
     notify_api_key = os.environ.get("NOTIFY_API_KEY", "")
     
     if not notify_url:
         return  # Notification not configured
     
+    global _notify_client
     try:
+        if _notify_client is None:
+            _notify_client = httpx.AsyncClient(http2=True, timeout=5.0)
+        
         headers = {}
         if notify_api_key:
             headers["X-API-Key"] = notify_api_key
         
-        requests.post(
+        await _notify_client.post(
             notify_url,
             json={"title": title, "message": message, "channel": "alert", "priority": priority},
             headers=headers,
-            timeout=5,
         )
-    except:
+    except Exception:
         pass  # Don't let notification failure affect trading
 
 
+async def close_notify_client():
+    """Close the shared notification client."""
+    global _notify_client
+    if _notify_client is not None:
+        await _notify_client.aclose()
+        _notify_client = None
+
+
 class Maker:
     """Market making logic."""
     
+    # Max time spent flushing queued notifications on shutdown
+    NOTIFY_DRAIN_SEC = 2.0
+    
     def __init__(self, config: Config, client: StandXHTTPClient, state: State):
         self.config = config
         self.client = client
         self.state = state
         self._running = False
         self._pending_check = asyncio.Event()
-        self._reduce_log_file = None  # Will be set by main.py
-        self._last_force_flat_check = 0.0
+        # Serializes _tick and the scheduled force-flat check
+        self._tick_lock = asyncio.Lock()
+        self._force_flat_handle: Optional[asyncio.TimerHandle] = None
+        self._force_flat_task: Optional[asyncio.Task] = None
+        self._force_flat_interval = max(0, int(config.force_flat_check_sec))
+        self._notify_queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+        self._reduce_log_fh = None  # Opened by set_reduce_log_file (main.py)
+        # (price_bucket, position, has_buy, has_sell, volatility_ok) of the last full tick
+        self._last_tick_key: Optional[tuple] = None
+        
+        # Price tick is fixed for the symbol, so resolve it once up front
+        if config.symbol.startswith("BTC"):
+            self._tick_size = 0.01
+            price_decimals = 2
+        else:
+            self._tick_size = 0.1
+            price_decimals = 1
+        self._inv_tick = 1 / self._tick_size
+        self._price_fmt = f"{{:.{price_decimals}f}}".format
+        self._qty_fmt = "{:.3f}".format
+        self._order_qty_str = self._qty_fmt(config.order_size_btc)
+        
+        # Pre-bound hot-path methods
+        self._set_order = state.set_order
+        self._has_order = state.has_order
+        self._new_order = client.new_order
+        self._cancel_orders = client.cancel_orders
     
     async def initialize(self):
         """Initialize state from exchange."""
@@ -76,20 +122,8 @@ class Maker:
         orders = await self.client.query_open_orders(self.config.symbol)
         
         for order in orders:
-            if order.side == "buy":
-                self.state.set_order("buy", OpenOrder(
-                    cl_ord_id=order.cl_ord_id,
-                    side="buy",
-                    price=float(order.price),
-                    qty=float(order.qty),
-                ))
-            elif order.side == "sell":
-                self.state.set_order("sell", OpenOrder(
-                    cl_ord_id=order.cl_ord_id,
-                    side="sell",
-                    price=float(order.price),
-                    qty=float(order.qty),
-                ))
+            if order.side in ("buy", "sell"):
+                self.state.set_order(order.side, OpenOrder.from_exchange(order, order.side))
         
         logger.info(
             f"Initialized: position={self.state.position}, "
@@ -111,47 +145,118 @@ class Maker:
         """Run the event-driven maker loop."""
         self._running = True
         logger.info("Maker started (event-driven mode)")
+        notify_task = asyncio.create_task(self._notify_worker(), name="maker_notify")
         
-        while self._running:
-            try:
-                # Wait for price update signal (with timeout for periodic checks)
+        try:
+            # Force-flat runs on its own cadence, independent of price updates.
+            # The first check runs before any tick so a position held at startup
+            # is flattened immediately; _run_force_flat then re-arms the timer.
+            if self._force_flat_interval:
+                await self._run_force_flat()
+            
+            while self._running:
                 try:
-                    await asyncio.wait_for(self._pending_check.wait(), timeout=5.0)
+                    # Wait for price update / order event signal
+                    await self._pending_check.wait()
                     self._pending_check.clear()
-                except asyncio.TimeoutError:
-                    # Periodic check even without price updates
-                    pass
                 
-                await self._tick()
+                    async with self._tick_lock:
+                        await self._tick()
                 
-            except Exception as e:
-                logger.error(f"Maker tick error: {e}", exc_info=True)
-                await asyncio.sleep(1)  # Brief pause on error
+                except Exception as e:
+                    self._last_tick_key = None
+                    logger.error(f"Maker tick error: {e}", exc_info=True)
+                    await asyncio.sleep(1)  # Brief pause on error
+        finally:
+            self._running = False  # Keep _run_force_flat from re-arming
+            if self._force_flat_handle:
+                self._force_flat_handle.cancel()
+            # Don't leave a force-flat order in flight while main.py closes the HTTP client
+            force_flat_task = self._force_flat_task
+            if force_flat_task and not force_flat_task.done():
+                force_flat_task.cancel()
+                await asyncio.wait([force_flat_task])
+            try:
+                # Give queued alerts (e.g. failed cancel/flat) a chance to go out
+                await asyncio.wait_for(self._notify_queue.join(), timeout=self.NOTIFY_DRAIN_SEC)
+            except asyncio.TimeoutError:
+                logger.warning(f"Dropping {self._notify_queue.qsize()} unsent notifications on shutdown")
+            finally:
+                notify_task.cancel()
         
         logger.info("Maker stopped")
     
+    def _arm_force_flat(self):
+        """Schedule the next force-flat check (disabled when interval is 0)."""
+        if not self._running or self._force_flat_interval == 0:
+            return
+        loop = asyncio.get_running_loop()
+        self._force_flat_handle = loop.call_later(self._force_flat_interval, self._schedule_force_flat)
+    
+    def _schedule_force_flat(self):
+        """Timer callback: run the force-flat check as a task."""
+        self._force_flat_task = asyncio.create_task(self._run_force_flat(), name="maker_force_flat")
+    
+    async def _run_force_flat(self):
+        """Run one force-flat check serialized with _tick, then re-arm."""
+        try:
+            async with self._tick_lock:
+                await self._force_flat_if_position()
+        except Exception as e:
+            logger.error(f"Force-flat check error: {e}", exc_info=True)
+        finally:
+            self._arm_force_flat()
+    
+    def _notify(self, title: str, message: str, priority: str = "normal"):
+        """Queue a notification without blocking the trading loop (dropped if backlog is full)."""
+        try:
+            self._notify_queue.put_nowait((title, message, priority))
+        except asyncio.QueueFull:
+            logger.warning(f"Notification queue full, dropping: {title}")
+    
+    async def _notify_worker(self):
+        """Drain queued notifications in the background."""
+        while True:
+            title, message, priority = await self._notify_queue.get()
+            try:
+                await send_notify(title, message, priority)
+            finally:
+                self._notify_queue.task_done()
+    
     async def stop(self):
         """Stop the maker loop."""
         self._running = False
         self._pending_check.set()  # Wake up the loop
+        self.close_reduce_log()
     
     async def _tick(self):
         """Single iteration of the maker logic."""
-        # Step 0: Periodic safety check to cancel orders and flatten position if needed
-        forced = await self._force_flat_if_position()
-        if forced:
-            return
-
+        cfg = self.config
+        st = self.state
+        
         # Wait for price data
-        if self.state.last_price is None:
+        last_price = st.last_price
+        if last_price is None:
             logger.debug("Waiting for price data...")
             return
         
+        # Step 0: Skip if nothing relevant changed since the last tick
+        tick_key = (
+            int(last_price * self._inv_tick),
+            st.position,
+            self._has_order("buy"),
+            self._has_order("sell"),
+            st.get_volatility_bps() <= cfg.volatility_threshold_bps,
+        )
+        if tick_key == self._last_tick_key:
+            return
+        self._last_tick_key = tick_key
+        
         # Step 1: Check position
-        if abs(self.state.position) >= self.config.max_position_btc:
+        if st.abs_position >= cfg.max_position_btc:
             logger.warning(
-                f"Position too large: {self.state.position} >= {self.config.max_position_btc}, "
-                "pausing market making"
+                "Position too large: %s >= %s, pausing market making",
+                st.position, cfg.max_position_btc,
             )
             return
         
@@ -161,33 +266,36 @@ class Maker:
             return  # Skip this tick after reducing
         
         # Step 2: Check and cancel orders that are too close or too far
-        orders_to_cancel = self.state.get_orders_to_cancel(
-            self.config.cancel_distance_bps,
-            self.config.rebalance_distance_bps
+        orders_to_cancel = st.get_orders_to_cancel(
+            cfg.cancel_distance_bps,
+            cfg.rebalance_distance_bps
         )
         
         if orders_to_cancel:
-            for order in orders_to_cancel:
-                logger.info(f"Cancelling order: {order.cl_ord_id}")
-                try:
-                    await self.client.cancel_order(order.cl_ord_id)
-                    self.state.set_order(order.side, None)
-                except Exception as e:
-                    logger.error(f"Failed to cancel order {order.cl_ord_id}: {e}")
-                    send_notify(
-                        "StandX 撤单失败",
-                        f"{self.config.symbol} 撤单失败: {e}",
-                        priority="high"
-                    )
+            cl_ord_ids = [order.cl_ord_id for order in orders_to_cancel]
+            logger.info(f"Cancelling orders: {cl_ord_ids}")
+            try:
+                await self._cancel_orders(cl_ord_ids)
+                for order in orders_to_cancel:
+                    self._set_order(order.side, None)
+            except Exception as e:
+                self._last_tick_key = None  # Retry on next tick
+                logger.error(f"Failed to cancel orders {cl_ord_ids}: {e}")
+                self._notify(
+                    "StandX 撤单失败",
+                    f"{cfg.symbol} 撤单失败: {e}",
+                    priority="high"
+                )
             
             # Don't place new orders this tick
             return
         
         # Step 3: Check volatility
-        volatility = self.state.get_volatility_bps()
-        if volatility > self.config.volatility_threshold_bps:
+        volatility = st.get_volatility_bps()
+        threshold_bps = cfg.volatility_threshold_bps
+        if volatility > threshold_bps:
             logger.debug(
-                f"Volatility too high: {volatility:.2f}bps > {self.config.volatility_threshold_bps}bps"
+                "Volatility too high: %.2fbps > %sbps", volatility, threshold_bps
             )
             return
         
@@ -200,43 +308,41 @@ class Maker:
         if last_price is None:
             return
         
-        # Calculate order prices
-        buy_price = last_price * (1 - self.config.order_distance_bps / 10000)
-        sell_price = last_price * (1 + self.config.order_distance_bps / 10000)
+        # Calculate order prices (bps -> fraction once, then multiply)
+        offset = last_price * (self.config.order_distance_bps * 1e-4)
+        buy_price = last_price - offset
+        sell_price = last_price + offset
         
-        # Place buy order if missing
-        if not self.state.has_order("buy"):
-            await self._place_order("buy", buy_price)
+        # Place missing sides concurrently (independent orders)
+        placements = []
+        if not self._has_order("buy"):
+            placements.append(self._place_order("buy", buy_price))
+        if not self._has_order("sell"):
+            placements.append(self._place_order("sell", sell_price))
         
-        # Place sell order if missing
-        if not self.state.has_order("sell"):
-            await self._place_order("sell", sell_price)
+        if placements:
+            results = await asyncio.gather(*placements, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    self._last_tick_key = None  # Retry on next tick
+                    logger.error(f"Order placement error: {result}", exc_info=result)
     
     async def _place_order(self, side: str, price: float):
         """Place a single order."""
-        import math
-        cl_ord_id = f"mm-{side}-{uuid.uuid4().hex[:8]}"
-        
-        # Different tick sizes for different symbols
-        if self.config.symbol.startswith("BTC"):
-            tick_size = 0.01
-            price_decimals = 2
-        else:
-            tick_size = 0.1
-            price_decimals = 1
+        cl_ord_id = f"mm-{side}-{secrets.token_hex(4)}"
         
         # Align price to tick (floor for buy, ceil for sell)
         if side == "buy":
-            aligned_price = math.floor(price / tick_size) * tick_size
+            ticks = math.floor(price * self._inv_tick)
         else:
-            aligned_price = math.ceil(price / tick_size) * tick_size
-        price_str = f"{aligned_price:.{price_decimals}f}"
-        qty_str = f"{self.config.order_size_btc:.3f}"
+            ticks = math.ceil(price * self._inv_tick)
+        price_str = self._price_fmt(ticks * self._tick_size)
+        qty_str = self._order_qty_str
         
         logger.info(f"Placing {side} order: {qty_str} @ {price_str} (cl_ord_id: {cl_ord_id})")
         
         try:
-            response = await self.client.new_order(
+            response = await self._new_order(
                 symbol=self.config.symbol,
                 side=side,
                 qty=qty_str,
@@ -246,7 +352,7 @@ class Maker:
             
             if response.get("code") == 0:
                 # Update local state
-                self.state.set_order(side, OpenOrder(
+                self._set_order(side, OpenOrder(
                     cl_ord_id=cl_ord_id,
                     side=side,
                     price=price,
@@ -254,35 +360,48 @@ class Maker:
                 ))
                 logger.info(f"Order placed successfully: {cl_ord_id}")
             else:
+                self._last_tick_key = None  # Retry on next tick
                 error_msg = response.get("message", str(response))
                 logger.error(f"Order failed: {response}")
-                send_notify(
+                self._notify(
                     "StandX 下单失败",
                     f"{self.config.symbol} {side} 下单失败: {error_msg}",
                     priority="high"
                 )
                 
         except Exception as e:
+            self._last_tick_key = None  # Retry on next tick
             logger.error(f"Failed to place {side} order: {e}")
-            send_notify(
+            self._notify(
                 "StandX 下单异常",
                 f"{self.config.symbol} {side} 下单异常: {e}",
                 priority="high"
             )
     
     def set_reduce_log_file(self, filepath: str):
-        """Set the file path for reduce position logging."""
-        self._reduce_log_file = filepath
+        """Open the reduce position log (line-buffered append) for the bot's lifetime."""
+        self.close_reduce_log()
+        try:
+            self._reduce_log_fh = open(filepath, "a", buffering=1)
+        except OSError as e:
+            logger.error(f"Failed to open reduce log {filepath}: {e}")
+    
+    def close_reduce_log(self):
+        """Close the reduce position log if open."""
+        if self._reduce_log_fh:
+            try:
+                self._reduce_log_fh.close()
+            except OSError:
+                pass
+            self._reduce_log_fh = None
     
     def _write_reduce_log(self, action: str, qty_change: float, reason: str):
         """Write reduce position log."""
-        if not self._reduce_log_file:
+        if not self._reduce_log_fh:
             return
         try:
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            with open(self._reduce_log_file, "a") as f:
-                f.write(f"{timestamp},{action},{qty_change:+.4f},{reason}\n")
+            timestamp = _now().strftime("%Y-%m-%d %H:%M:%S")
+            self._reduce_log_fh.write(f"{timestamp},{action},{qty_change:+.4f},{reason}\n")
         except:
             pass
     
@@ -301,7 +420,8 @@ class Maker:
         threshold = max_pos * 0.7
         target = max_pos * 0.5
         
-        current_pos = abs(self.state.position)
+        st = self.state
+        current_pos = st.abs_position
         if current_pos <= threshold:
             return False
         
@@ -313,7 +433,7 @@ class Maker:
             
             upnl = positions[0].upnl
             if upnl <= 0:
-                logger.debug(f"Position {current_pos:.4f} > threshold but uPNL={upnl:.2f} <= 0, skip reduce")
+                logger.debug("Position %.4f > threshold but uPNL=%.2f <= 0, skip reduce", current_pos, upnl)
                 return False
             
             # Calculate reduce quantity
@@ -322,22 +442,20 @@ class Maker:
                 return False
             
             # Determine side: if position is long, sell to reduce; if short, buy to reduce
-            if self.state.position > 0:
-                reduce_side = "sell"
-            else:
-                reduce_side = "buy"
+            reduce_side = "sell" if st.position_sign > 0 else "buy"
             
+            pos = st.position
+            new_pos = pos - reduce_qty if st.position_sign > 0 else pos + reduce_qty
             logger.info(
-                f"Reducing position: {self.state.position:+.4f} -> {'+' if self.state.position > 0 else ''}{self.state.position - reduce_qty if self.state.position > 0 else self.state.position + reduce_qty:.4f}, "
-                f"qty={reduce_qty:.4f}, side={reduce_side}, uPNL=${upnl:.2f}"
+                "Reducing position: %+.4f -> %+.4f, qty=%.4f, side=%s, uPNL=$%.2f",
+                pos, new_pos, reduce_qty, reduce_side, upnl,
             )
             
             # Place market order to reduce
-            import math
-            cl_ord_id = f"reduce-{uuid.uuid4().hex[:8]}"
+            cl_ord_id = f"reduce-{secrets.token_hex(4)}"
             
             # Format quantity
-            qty_str = f"{reduce_qty:.3f}"
+            qty_str = self._qty_fmt(reduce_qty)
             
             response = await self.client.new_order(
                 symbol=self.config.symbol,
@@ -352,31 +470,24 @@ class Maker:
             if response.get("code") == 0 or "id" in response:
                 logger.info(f"Reduce order placed: {cl_ord_id}")
                 self._write_reduce_log("REDUCE", -reduce_qty if reduce_side == "sell" else reduce_qty, f"profit_take_upnl_{upnl:.2f}")
-                send_notify(
+                self._notify(
                     "仓位减仓",
                     f"{self.config.symbol} 减仓 {reduce_qty:.4f}，uPNL=${upnl:.2f}",
                     priority="normal"
                 )
                 return True
             else:
+                self._last_tick_key = None  # Retry on next tick
                 logger.error(f"Reduce order failed: {response}")
                 return False
                 
         except Exception as e:
+            self._last_tick_key = None  # Retry on next tick
             logger.error(f"Failed to check/reduce position: {e}")
             return False
 
     async def _force_flat_if_position(self) -> bool:
-        """Cancel all open orders and close any open position on a timer."""
-        interval = max(0, int(self.config.force_flat_check_sec))
-        if interval == 0:
-            return False
-
-        now = time.monotonic()
-        if now - self._last_force_flat_check < interval:
-            return False
-        self._last_force_flat_check = now
-
+        """Cancel all open orders and close any open position (scheduled by _arm_force_flat)."""
         try:
             positions = await self.client.query_positions(self.config.symbol)
         except Exception as e:
@@ -385,8 +496,10 @@ class Maker:
 
         pos_qty = positions[0].qty if positions else 0.0
         self.state.update_position(pos_qty)
+        close_qty = self.state.abs_position
+        close_side = "sell" if self.state.position_sign > 0 else "buy"
 
-        if abs(pos_qty) <= 0:
+        if close_qty <= 0:
             return False
 
         logger.warning(f"Force-flat triggered: position={pos_qty:+.4f}")
@@ -401,20 +514,15 @@ class Maker:
             self.state.clear_all_orders()
         except Exception as e:
             logger.error(f"Force-flat cancel orders failed: {e}")
-            send_notify(
+            self._notify(
                 "StandX 撤单失败",
                 f"{self.config.symbol} 强制平仓前撤单失败: {e}",
                 priority="high"
             )
 
         # Close position with reduce-only market order
-        close_side = "sell" if pos_qty > 0 else "buy"
-        close_qty = abs(pos_qty)
-        if close_qty <= 0:
-            return False
-
-        cl_ord_id = f"flat-{uuid.uuid4().hex[:8]}"
-        qty_str = f"{close_qty:.3f}"
+        cl_ord_id = f"flat-{secrets.token_hex(4)}"
+        qty_str = self._qty_fmt(close_qty)
         try:
             response = await self.client.new_order(
                 symbol=self.config.symbol,
@@ -427,21 +535,21 @@ class Maker:
             )
             if response.get("code") == 0 or "id" in response:
                 logger.info(f"Force-flat order placed: {cl_ord_id} qty={qty_str} side={close_side}")
-                send_notify(
+                self._notify(
                     "仓位强制平仓",
                     f"{self.config.symbol} 强制平仓 {close_qty:.4f} ({close_side})",
                     priority="high"
                 )
                 return True
             logger.error(f"Force-flat order failed: {response}")
-            send_notify(
+            self._notify(
                 "StandX 强制平仓失败",
                 f"{self.config.symbol} 强制平仓失败: {response}",
                 priority="high"
             )
         except Exception as e:
             logger.error(f"Force-flat order exception: {e}")
-            send_notify(
+            self._notify(
                 "StandX 强制平仓异常",
                 f"{self.config.symbol} 强制平仓异常: {e}",
                 priority="high"
@@ -8,6 +8,7 @@ Maintains:
 """
 import time
 import logging
+from collections import deque
 from typing import Optional, Dict
 from dataclasses import dataclass, field
 from threading import Lock
@@ -16,13 +17,25 @@ from threading import Lock
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class OpenOrder:
     """Represents an open order we're tracking."""
     cl_ord_id: str
     side: str
     price: float
     qty: float
+    
+    @classmethod
+    def from_exchange(cls, order, side: str) -> "OpenOrder":
+        """Build from an exchange-reported order, converting price/qty only if needed."""
+        price = order.price
+        qty = order.qty
+        return cls(
+            order.cl_ord_id,
+            side,
+            price if type(price) is float else float(price),
+            qty if type(qty) is float else float(qty),
+        )
 
 
 @dataclass
@@ -31,10 +44,16 @@ class State:
     
     # Price data
     last_price: Optional[float] = None
-    price_window: list = field(default_factory=list)  # [(timestamp, price), ...]
+    price_window: deque = field(default_factory=deque)  # [(timestamp, price), ...]
+    # Monotonic deques of (timestamp, price) for O(1) window max/min
+    _window_max: deque = field(default_factory=deque)
+    _window_min: deque = field(default_factory=deque)
+    _volatility_bps: float = float("inf")
     
-    # Position
+    # Position (abs/sign kept alongside so readers don't recompute them)
     position: float = 0.0
+    abs_position: float = 0.0
+    position_sign: int = 0  # 1 long, -1 short, 0 flat
     
     # Open orders (one buy, one sell max)
     open_orders: Dict[str, Optional[OpenOrder]] = field(default_factory=lambda: {"buy": None, "sell": None})
@@ -43,38 +62,55 @@ class State:
     _lock: Lock = field(default_factory=Lock)
     
     def update_price(self, price: float, window_sec: int = 5):
-        """Update price and maintain sliding window."""
+        """Update price, maintain sliding window and cached volatility."""
         with self._lock:
             now = time.time()
             self.last_price = price
             self.price_window.append((now, price))
             
+            window_max = self._window_max
+            while window_max and window_max[-1][1] <= price:
+                window_max.pop()
+            window_max.append((now, price))
+            
+            window_min = self._window_min
+            while window_min and window_min[-1][1] >= price:
+                window_min.pop()
+            window_min.append((now, price))
+            
             # Clean up old data
             cutoff = now - window_sec
-            self.price_window = [(t, p) for t, p in self.price_window if t > cutoff]
+            window = self.price_window
+            while window and window[0][0] <= cutoff:
+                window.popleft()
+            while window_max and window_max[0][0] <= cutoff:
+                window_max.popleft()
+            while window_min and window_min[0][0] <= cutoff:
+                window_min.popleft()
+            
+            if len(window) < 2 or price == 0:
+                self._volatility_bps = float("inf")
+            else:
+                self._volatility_bps = (window_max[0][1] - window_min[0][1]) / price * 10000
     
     def get_volatility_bps(self) -> float:
         """
-        Calculate volatility in bps over the price window.
+        Get volatility in bps over the price window.
+        
+        Maintained incrementally by update_price, so this is O(1).
         
         Returns:
             Volatility in basis points, or inf if insufficient data
         """
         with self._lock:
-            if len(self.price_window) < 2:
-                return float("inf")
-            
-            prices = [p for _, p in self.price_window]
-            if prices[-1] == 0:
-                return float("inf")
-            
-            volatility = (max(prices) - min(prices)) / prices[-1] * 10000
-            return volatility
+            return self._volatility_bps
     
     def update_position(self, qty: float):
         """Update position quantity."""
         with self._lock:
             self.position = qty
+            self.abs_position = abs(qty)
+            self.position_sign = 1 if qty > 0 else (-1 if qty < 0 else 0)
             logger.info(f"Position updated: {qty}")
     
     def set_order(self, side: str, order: Optional[OpenOrder]):
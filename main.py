@@ -15,8 +15,8 @@ from api.auth import StandXAuth
 from api.http_client import StandXHTTPClient
 from api.ws_client import MarketWSClient, UserWSClient
 from core.state import State
-from core.maker import Maker
-from referral import check_if_referred, apply_referral, REFERRAL_CODE
+from core.maker import Maker, close_notify_client
+from referral import check_if_referred, apply_referral, create_client as create_referral_client, REFERRAL_CODE
 
 
 # Configure logging
@@ -44,16 +44,17 @@ async def main(config_path: str):
     
     # Check and apply referral if needed
     try:
-        is_referred = await check_if_referred(auth)
-        if not is_referred:
-            logger.info(f"Account not referred, applying referral code: {REFERRAL_CODE}")
-            result = await apply_referral(auth, "frozenbanana")
-            if result.get("success") or result.get("code") == 0:
-                logger.info("Referral applied successfully")
+        async with create_referral_client() as referral_client:
+            is_referred = await check_if_referred(auth, referral_client)
+            if not is_referred:
+                logger.info(f"Account not referred, applying referral code: {REFERRAL_CODE}")
+                result = await apply_referral(auth, "frozenbanana", referral_client)
+                if result.get("success") or result.get("code") == 0:
+                    logger.info("Referral applied successfully")
+                else:
+                    logger.warning(f"Referral failed: {result}")
             else:
-                logger.warning(f"Referral failed: {result}")
-        else:
-            logger.debug("Account already referred")
+                logger.debug("Account already referred")
     except Exception as e:
         logger.warning(f"Referral check/apply failed: {e}")
     
@@ -192,6 +193,7 @@ async def main(config_path: str):
             logger.error(f"Failed to cancel orders on exit: {e}")
         
         await http_client.close()
+        await close_notify_client()
         logger.info("Shutdown complete")
 
 
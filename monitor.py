@@ -11,11 +11,11 @@ import argparse
 import time
 import logging
 import os
+import hashlib
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import List, Dict, Set
 
-import requests
 import httpx
 
 # Load .env file if exists
@@ -39,10 +39,47 @@ POLL_INTERVAL_SEC = 300  # 5 minutes
 STATUS_REPORT_INTERVAL_SEC = 2 * 60 * 60  # 2 hours
 EQUITY_DROP_THRESHOLD = 0.10  # 10% drop triggers alert
 POSITION_ALERT_MULTIPLIER = 5  # Alert if position > order_size * 5
+MAX_HTTP_CONCURRENCY = 20  # Cap on in-flight exchange requests across all accounts
+ALERT_COOLDOWN_SEC = 3 * POLL_INTERVAL_SEC  # Max one non-critical alert per (account, title, channel) per window
 STATUS_LOG_FILE = "status.log"
+_UPTIME_GLYPHS = ("░", "█")  # Indexed by bool: (DOWN, UP)
+
+# Stats endpoints polled for every account
+URLS = {
+    "trader": "https://api.standx.com/v1/offchain/trading-campaign/points",
+    "maker": "https://api.standx.com/v1/offchain/maker-campaign/points",
+    "holder": "https://api.standx.com/v1/offchain/perps-campaign/points",
+    "uptime": "https://perps.standx.com/api/maker/uptime",
+}
+
+# Digest of the last written status body (timestamp header excluded)
+_last_status_hash: bytes | None = None
+
+# Shared pooled client for all account queries, created in main()
+HTTP_CLIENT: httpx.AsyncClient | None = None
+_HTTP_SEM = asyncio.Semaphore(MAX_HTTP_CONCURRENCY)
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the pooled client; keep-alive outlives the poll interval so sockets are reused."""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(30.0),
+        limits=httpx.Limits(
+            max_keepalive_connections=20,
+            max_connections=100,
+            keepalive_expiry=POLL_INTERVAL_SEC + 15,
+        ),
+    )
+
 
+async def http_get(url: str, headers: Dict) -> httpx.Response:
+    """GET through the shared client, bounded by MAX_HTTP_CONCURRENCY."""
+    async with _HTTP_SEM:
+        return await HTTP_CLIENT.get(url, headers=headers)
 
-def send_notify(title: str, message: str, channel: str = "info", priority: str = "normal"):
+
+async def send_notify(title: str, message: str, channel: str = "info", priority: str = "normal"):
     """Send notification via Telegram.
     
     Requires environment variables:
@@ -62,15 +99,15 @@ def send_notify(title: str, message: str, channel: str = "info", priority: str =
         if notify_api_key:
             headers["X-API-Key"] = notify_api_key
         
-        requests.post(
+        await HTTP_CLIENT.post(
             notify_url,
             json={"title": title, "message": message, "channel": channel, "priority": priority},
             headers=headers,
-            timeout=10,
+            timeout=10.0,
         )
-        logger.info(f"Notification sent: [{priority}] {title}")
+        logger.info("Notification sent: [%s] %s", priority, title)
     except Exception as e:
-        logger.error(f"Failed to send notification: {e}")
+        logger.error("Failed to send notification: %s", e)
 
 
 @dataclass
@@ -79,6 +116,7 @@ class AccountState:
     config_path: str
     config: Config
     auth: StandXAuth
+    name: str = ""  # Display name derived from config_path
     initial_equity: float = 0.0
     current_equity: float = 0.0
     position: float = 0.0  # Position size (negative = short)
@@ -90,6 +128,17 @@ class AccountState:
     latency_stats: dict = field(default_factory=dict)  # {endpoint: (avg_ms, max_ms)}
     low_equity_alerted: bool = False
     high_position_alerted: bool = False
+    alert_last_sent: Dict[str, float] = field(default_factory=dict)  # {"title|channel": monotonic ts}
+    suppressed_alerts: Dict[str, int] = field(default_factory=dict)  # {title: count} since last report
+    pending_alerts: Set[str] = field(default_factory=set)  # {"title|channel"} suppressed and not yet sent
+
+
+def account_display_name(config_path: str) -> str:
+    """Derive a short display name from a config path (config-bot2.yaml -> bot2, config.yaml -> main)."""
+    name = config_path.removesuffix(".yaml")
+    if name == "config":
+        return "main"
+    return name.removeprefix("config-")
 
 
 def read_latency_stats(config_path: str, window_hours: float = 2.0) -> dict:
@@ -136,38 +185,43 @@ def read_latency_stats(config_path: str, window_hours: float = 2.0) -> dict:
         return {}
 
 
-async def query_balance(auth: StandXAuth) -> Dict:
+def build_request_headers(auth: StandXAuth) -> tuple[Dict, Dict]:
+    """Build (auth_headers, bearer_headers) once per poll cycle.
+    
+    auth_headers: perps API headers (balance, positions, uptime)
+    bearer_headers: plain bearer token headers (points endpoints)
+    """
+    auth_headers = auth.get_auth_headers()
+    auth_headers["Accept"] = "application/json"
+    return auth_headers, auth.bearer_headers
+
+
+async def query_balance(headers: Dict) -> Dict:
     """Query account balance and position."""
     url = "https://perps.standx.com/api/query_balance"
-    headers = auth.get_auth_headers()
-    headers["Accept"] = "application/json"
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
+    response = await http_get(url, headers)
+    response.raise_for_status()
+    return response.json()
 
 
-async def query_position(auth: StandXAuth, symbol: str) -> Dict:
+async def query_position(headers: Dict, symbol: str) -> Dict:
     """Query position for a symbol."""
     url = f"https://perps.standx.com/api/query_positions?symbol={symbol}"
-    headers = auth.get_auth_headers()
-    headers["Accept"] = "application/json"
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, headers=headers)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Handle both list and dict response formats
-        if isinstance(data, list):
-            positions = data
-        else:
-            positions = data.get("positions", [])
-        
-        if positions:
-            return positions[0]
-        return {}
+    response = await http_get(url, headers)
+    response.raise_for_status()
+    data = response.json()
+    
+    # Handle both list and dict response formats
+    if isinstance(data, list):
+        positions = data
+    else:
+        positions = data.get("positions", [])
+    
+    if positions:
+        return positions[0]
+    return {}
 
 
 def build_uptime_bar(hours_data: List[Dict]) -> str:
@@ -182,29 +236,19 @@ def build_uptime_bar(hours_data: List[Dict]) -> str:
     # Round down to current hour
     current_hour = now.replace(minute=0, second=0, microsecond=0)
     
-    # Build set of hours that have uptime data
-    uptime_hours = set()
-    for h in hours_data:
-        hour_str = h.get("hour", "")
-        try:
-            dt = datetime.fromisoformat(hour_str.replace("Z", "+00:00"))
-            uptime_hours.add(dt.replace(minute=0, second=0, microsecond=0))
-        except:
-            pass
-    
-    # Build bar for last 12 hours (oldest to newest)
-    bar = ""
-    for i in range(11, -1, -1):  # 11 hours ago to now
-        hour = current_hour - timedelta(hours=i)
-        if hour in uptime_hours:
-            bar += "█"
-        else:
-            bar += "░"
+    # API hours are UTC ISO-8601 ("2024-05-12T08:00:00Z"), so the first 13 chars are the bucket
+    uptime_hours = frozenset(
+        h["hour"][:13] for h in hours_data if isinstance(h.get("hour"), str)
+    )
     
-    return bar
+    # Single pass over the last 12 hour buckets (oldest to newest), keyed as "YYYY-MM-DDTHH"
+    return "".join(
+        _UPTIME_GLYPHS[(current_hour - timedelta(hours=i)).strftime("%Y-%m-%dT%H") in uptime_hours]
+        for i in range(11, -1, -1)
+    )
 
 
-async def query_all_stats(auth: StandXAuth) -> Dict:
+async def query_all_stats(bearer_headers: Dict, auth_headers: Dict) -> Dict:
     """Query all points and uptime for an account."""
     stats = {
         "trader_pts": 0.0,
@@ -213,43 +257,50 @@ async def query_all_stats(auth: StandXAuth) -> Dict:
         "uptime_12h": "░" * 12,  # Default: all down
     }
     
-    headers = {"Authorization": f"Bearer {auth.token}", "Accept": "application/json"}
-    
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async def _fetch_trader():
         # Trading campaign (Trader Points)
-        try:
-            r = await client.get("https://api.standx.com/v1/offchain/trading-campaign/points", headers=headers)
-            if r.status_code == 200:
-                stats["trader_pts"] = float(r.json().get("trading_point", 0) or 0) / 1_000_000
-        except:
-            pass
-        
+        r = await http_get(URLS["trader"], bearer_headers)
+        if r.status_code == 200:
+            return "trader_pts", float(r.json().get("trading_point", 0) or 0) / 1_000_000
+    
+    async def _fetch_maker():
         # Maker campaign (Maker Points)
-        try:
-            r = await client.get("https://api.standx.com/v1/offchain/maker-campaign/points", headers=headers)
-            if r.status_code == 200:
-                stats["maker_pts"] = float(r.json().get("maker_point", 0) or 0) / 1_000_000
-        except:
-            pass
-        
+        r = await http_get(URLS["maker"], bearer_headers)
+        if r.status_code == 200:
+            return "maker_pts", float(r.json().get("maker_point", 0) or 0) / 1_000_000
+    
+    async def _fetch_holder():
         # Perps campaign (Holder Points)
-        try:
-            r = await client.get("https://api.standx.com/v1/offchain/perps-campaign/points", headers=headers)
-            if r.status_code == 200:
-                stats["holder_pts"] = float(r.json().get("total_point", 0) or 0) / 1_000_000
-        except:
-            pass
-        
+        r = await http_get(URLS["holder"], bearer_headers)
+        if r.status_code == 200:
+            return "holder_pts", float(r.json().get("total_point", 0) or 0) / 1_000_000
+    
+    async def _fetch_uptime():
         # Uptime (12 hours visualization)
+        r = await http_get(URLS["uptime"], auth_headers)
+        if r.status_code == 200:
+            return "uptime_12h", build_uptime_bar(r.json().get("hours", []))
+    
+    async def _guarded(fetch):
+        # Expected request/parse failures keep the default; anything else
+        # (including cancellation) propagates
         try:
-            uptime_headers = auth.get_auth_headers("")
-            uptime_headers["Accept"] = "application/json"
-            r = await client.get("https://perps.standx.com/api/maker/uptime", headers=uptime_headers)
-            if r.status_code == 200:
-                hours = r.json().get("hours", [])
-                stats["uptime_12h"] = build_uptime_bar(hours)
-        except:
-            pass
+            return await fetch()
+        except (httpx.HTTPError, ValueError, KeyError, AttributeError, TypeError) as e:
+            logger.debug("stats fetch %s failed: %s", fetch.__name__, e)
+            return None
+    
+    # Independent endpoints: fetch concurrently, keep defaults for any that fail
+    results = await asyncio.gather(
+        _guarded(_fetch_trader),
+        _guarded(_fetch_maker),
+        _guarded(_fetch_holder),
+        _guarded(_fetch_uptime),
+    )
+    for result in results:
+        if result is not None:
+            key, value = result
+            stats[key] = value
     
     return stats
 
@@ -259,11 +310,12 @@ async def init_account(config_path: str) -> AccountState:
     config = load_config(config_path)
     auth = StandXAuth()
     
-    logger.info(f"Authenticating: {config_path}")
+    logger.info("Authenticating: %s", config_path)
     await auth.authenticate(config.wallet.chain, config.wallet.private_key)
     
     # Get initial balance
-    balance_data = await query_balance(auth)
+    auth_headers, _ = build_request_headers(auth)
+    balance_data = await query_balance(auth_headers)
     equity = float(balance_data.get("equity", 0) or 0)
     
     logger.info(f"Account {config_path}: Initial equity ${equity:,.2f}")
@@ -272,6 +324,7 @@ async def init_account(config_path: str) -> AccountState:
         config_path=config_path,
         config=config,
         auth=auth,
+        name=account_display_name(config_path),
         initial_equity=equity,
         current_equity=equity,
     )
@@ -280,17 +333,18 @@ async def init_account(config_path: str) -> AccountState:
 async def poll_account(account: AccountState) -> bool:
     """Poll account status. Returns True if successful."""
     try:
-        # Query balance
-        balance_data = await query_balance(account.auth)
+        auth_headers, bearer_headers = build_request_headers(account.auth)
+        
+        # Query balance, position and stats concurrently
+        balance_data, pos_data, stats = await asyncio.gather(
+            query_balance(auth_headers),
+            query_position(auth_headers, account.config.symbol),
+            query_all_stats(bearer_headers, auth_headers),
+        )
         account.current_equity = float(balance_data.get("equity", 0) or 0)
         account.upnl = float(balance_data.get("upnl", 0) or 0)
-        
-        # Query position
-        pos_data = await query_position(account.auth, account.config.symbol)
         account.position = float(pos_data.get("qty", 0) or 0)
         
-        # Query stats
-        stats = await query_all_stats(account.auth)
         account.trader_pts = stats["trader_pts"]
         account.maker_pts = stats["maker_pts"]
         account.holder_pts = stats["holder_pts"]
@@ -301,11 +355,37 @@ async def poll_account(account: AccountState) -> bool:
         
         return True
     except Exception as e:
-        logger.error(f"Failed to poll {account.config_path}: {e}")
+        logger.error("Failed to poll %s: %s", account.config_path, e)
+        return False
+
+
+async def notify_account(account: AccountState, title: str, message: str, channel: str, priority: str) -> bool:
+    """Send an account alert, rate-limited per (title, channel).
+    
+    Critical alerts are never suppressed. Other alerts inside the cooldown
+    are counted and summarized in the next status report.
+    
+    Returns:
+        True if the alert was sent, False if suppressed
+    """
+    key = f"{title}|{channel}"
+    now = time.monotonic()
+    last_sent = account.alert_last_sent.get(key)
+    if priority != "critical" and last_sent is not None and now - last_sent < ALERT_COOLDOWN_SEC:
+        # A suppressed alert that is retried every poll only counts once
+        if key not in account.pending_alerts:
+            account.pending_alerts.add(key)
+            account.suppressed_alerts[title] = account.suppressed_alerts.get(title, 0) + 1
+        logger.info("Alert suppressed (cooldown): %s %s", account.config_path, title)
         return False
+    
+    account.alert_last_sent[key] = now
+    account.pending_alerts.discard(key)
+    await send_notify(title, message, channel=channel, priority=priority)
+    return True
 
 
-def check_equity_alert(account: AccountState):
+async def check_equity_alert(account: AccountState):
     """Check if equity dropped below threshold and send alert.
     
     After alerting, resets baseline to current equity so next alert
@@ -322,36 +402,36 @@ def check_equity_alert(account: AccountState):
             f"基准${account.initial_equity:,.0f} → 当前${account.current_equity:,.0f} "
             f"(降{drop_ratio*100:.1f}%)"
         )
-        send_notify("余额告警", msg, channel="alert", priority="critical")
+        await notify_account(account, "余额告警", msg, channel="alert", priority="critical")
         
         # Reset baseline to current equity
         # Next alert will only trigger on another 10% drop from here
         account.initial_equity = account.current_equity
 
 
-def check_position_alert(account: AccountState):
+async def check_position_alert(account: AccountState):
     """Check if position exceeds threshold and send alert."""
     order_size = account.config.order_size_btc
     threshold = order_size * POSITION_ALERT_MULTIPLIER
     
     if abs(account.position) > threshold and not account.high_position_alerted:
-        account.high_position_alerted = True
-        name = account.config_path.replace(".yaml", "").replace("config-", "").replace("config", "main")
         # Extract asset from symbol (e.g., BTC-USD -> BTC, ETH-USD -> ETH)
         asset = account.config.symbol.split("-")[0] if account.config.symbol else "BTC"
-        msg = f"{name} 仓位告警: {account.position:.4f} {asset} (阈值: ±{threshold:.4f})"
-        send_notify("仓位告警", msg, channel="info", priority="normal")
+        msg = f"{account.name} 仓位告警: {account.position:.4f} {asset} (阈值: ±{threshold:.4f})"
+        # Only mark as alerted once actually sent, so a suppressed alert is retried
+        account.high_position_alerted = await notify_account(
+            account, "仓位告警", msg, channel="info", priority="normal"
+        )
     
     # Reset alert if position reduced
     if abs(account.position) < threshold * 0.5:
         account.high_position_alerted = False
 
 
-def send_status_report(accounts: List[AccountState]):
+async def send_status_report(accounts: List[AccountState]):
     """Send periodic status report."""
     lines = []
     for acc in accounts:
-        name = acc.config_path.replace(".yaml", "").replace("config-", "").replace("config", "main")
         # Format: name: $equity pos uPNL pts uptime latency
         pos_str = f"pos:{acc.position:+.4f}"
         upnl_str = f"uPNL:{acc.upnl:+.2f}"
@@ -369,21 +449,26 @@ def send_status_report(accounts: List[AccountState]):
         else:
             latency_str = "延迟:-"
         
-        lines.append(f"{name}: ${acc.current_equity:,.0f} {pos_str} {upnl_str} {pts_str} {uptime_str} {latency_str}")
+        lines.append(f"{acc.name}: ${acc.current_equity:,.0f} {pos_str} {upnl_str} {pts_str} {uptime_str} {latency_str}")
+        
+        # Alerts held back by the cooldown since the last report
+        if acc.suppressed_alerts:
+            suppressed = " ".join(f"{title}x{count}" for title, count in acc.suppressed_alerts.items())
+            lines.append(f"  已抑制告警: {suppressed}")
+            acc.suppressed_alerts.clear()
+            acc.pending_alerts.clear()
     
     msg = "\n".join(lines)
-    send_notify("StandX 状态", msg, channel="info", priority="normal")
+    await send_notify("StandX 状态", msg, channel="info", priority="normal")
 
 
 def write_status_log(accounts: List[AccountState]):
     """Write current status to log file."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    lines = [f"=== StandX Monitor Status @ {timestamp} ===", ""]
+    global _last_status_hash
+    lines = []
     
     for acc in accounts:
-        name = acc.config_path.replace(".yaml", "").replace("config-", "").replace("config", "main")
-        lines.append(f"Account: {name}")
+        lines.append(f"Account: {acc.name}")
         lines.append(f"  Equity:     ${acc.current_equity:,.2f}")
         # Extract asset from symbol (e.g., BTC-USD -> BTC, ETH-USD -> ETH)
         asset = acc.config.symbol.split("-")[0] if acc.config.symbol else "BTC"
@@ -400,43 +485,67 @@ def write_status_log(accounts: List[AccountState]):
             lines.append("  Latency:    (no data)")
         lines.append("")
     
-    # Overwrite the file with current status
-    with open(STATUS_LOG_FILE, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    # Skip the write when nothing but the timestamp would change
+    body = "\n".join(lines)
+    status_hash = hashlib.blake2b(body.encode("utf-8"), digest_size=8).digest()
+    if status_hash == _last_status_hash:
+        return
+    
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    content = f"=== StandX Monitor Status @ {timestamp} ===\n\n{body}"
+    
+    # Write to a temp file and swap in atomically so readers never see a partial file
+    tmp_path = STATUS_LOG_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, STATUS_LOG_FILE)
+    _last_status_hash = status_hash
 
 
 async def monitor_loop(accounts: List[AccountState]):
-    """Main monitoring loop."""
-    last_report_time = 0
+    """Main monitoring loop.
+    
+    Polls run on a fixed monotonic schedule so poll duration does not
+    accumulate into the period.
+    """
+    loop = asyncio.get_running_loop()
     
     # Poll all accounts first to get points
-    for account in accounts:
-        await poll_account(account)
+    await asyncio.gather(*(poll_account(a) for a in accounts))
     
     # Send initial status report and write log
-    send_status_report(accounts)
-    write_status_log(accounts)
-    last_report_time = time.time()
+    await send_status_report(accounts)
+    await asyncio.to_thread(write_status_log, accounts)
+    last_report_time = loop.time()
+    next_tick = loop.time() + POLL_INTERVAL_SEC
     
     while True:
-        # Poll all accounts
-        for account in accounts:
-            success = await poll_account(account)
-            if success:
-                check_equity_alert(account)
-                check_position_alert(account)
+        # Poll all accounts concurrently
+        results = await asyncio.gather(
+            *(poll_account(a) for a in accounts),
+            return_exceptions=True,
+        )
+        for account, success in zip(accounts, results):
+            if success is True:
+                await check_equity_alert(account)
+                await check_position_alert(account)
         
         # Write status log after each poll
-        write_status_log(accounts)
+        await asyncio.to_thread(write_status_log, accounts)
         
         # Periodic status report (every 2 hours)
-        now = time.time()
+        now = loop.time()
         if now - last_report_time >= STATUS_REPORT_INTERVAL_SEC:
-            send_status_report(accounts)
+            await send_status_report(accounts)
             last_report_time = now
         
-        # Wait before next poll
-        await asyncio.sleep(POLL_INTERVAL_SEC)
+        # Wait until the next scheduled poll; if we overran, restart the schedule from now
+        delay = next_tick - loop.time()
+        if delay < 0:
+            next_tick = loop.time()
+            delay = 0
+        await asyncio.sleep(delay)
+        next_tick += POLL_INTERVAL_SEC
 
 
 async def main(config_paths: List[str]):
@@ -448,8 +557,8 @@ async def main(config_paths: List[str]):
     logger.info("=" * 50)
     logger.info("Notification Configuration:")
     if notify_url:
-        logger.info(f"  NOTIFY_URL: {notify_url}")
-        logger.info(f"  NOTIFY_API_KEY: {'*' * 8 if notify_api_key else '(not set)'}")
+        logger.info("  NOTIFY_URL: %s", notify_url)
+        logger.info("  NOTIFY_API_KEY: %s", "*" * 8 if notify_api_key else "(not set)")
         logger.info("  -> Telegram notifications ENABLED")
     else:
         logger.info("  NOTIFY_URL: (not set)")
@@ -457,27 +566,34 @@ async def main(config_paths: List[str]):
         logger.info("  -> Alerts will only be logged locally")
     logger.info("=" * 50)
     
-    logger.info(f"Starting monitor for {len(config_paths)} accounts")
+    logger.info("Starting monitor for %d accounts", len(config_paths))
     
-    # Initialize all accounts
-    accounts = []
-    for path in config_paths:
-        try:
-            account = await init_account(path)
-            accounts.append(account)
-        except Exception as e:
-            logger.error(f"Failed to init {path}: {e}")
-    
-    if not accounts:
-        logger.error("No accounts initialized, exiting")
-        return
-    
-    logger.info(f"Monitoring {len(accounts)} accounts, poll interval {POLL_INTERVAL_SEC}s")
+    global HTTP_CLIENT
+    HTTP_CLIENT = create_http_client()
     
     try:
-        await monitor_loop(accounts)
-    except KeyboardInterrupt:
-        logger.info("Monitor stopped")
+        # Initialize all accounts
+        accounts = []
+        for path in config_paths:
+            try:
+                account = await init_account(path)
+                accounts.append(account)
+            except Exception as e:
+                logger.error("Failed to init %s: %s", path, e)
+        
+        if not accounts:
+            logger.error("No accounts initialized, exiting")
+            return
+        
+        logger.info("Monitoring %d accounts, poll interval %ss", len(accounts), POLL_INTERVAL_SEC)
+        
+        try:
+            await monitor_loop(accounts)
+        except KeyboardInterrupt:
+            logger.info("Monitor stopped")
+    finally:
+        await HTTP_CLIENT.aclose()
+        HTTP_CLIENT = None
 
 
 def parse_args():
@@ -506,10 +622,14 @@ if __name__ == "__main__":
     
     # Auto-detect config files if none specified
     if not config_paths:
-        import glob
-        all_yamls = glob.glob("*.yaml") + glob.glob("*.yml")
-        # Exclude example config
-        config_paths = [f for f in all_yamls if not f.startswith("config.example")]
+        # Single directory pass; exclude example config
+        with os.scandir(".") as entries:
+            config_paths = sorted(
+                e.name for e in entries
+                if e.is_file()
+                and e.name.endswith((".yaml", ".yml"))
+                and not e.name.startswith("config.example")
+            )
         
         if config_paths:
             print(f"Auto-detected config files: {config_paths}")
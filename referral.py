@@ -24,22 +24,28 @@ REFERRAL_CODE = "xixi111"
 REFERRAL_URL = f"https://standx.com/referral?code={REFERRAL_CODE}"
 
 
-async def check_if_referred(auth: StandXAuth) -> bool:
+def create_client() -> httpx.AsyncClient:
+    """Create a client shared by the referral check and apply calls (same host)."""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=5, keepalive_expiry=30),
+    )
+
+
+async def check_if_referred(auth: StandXAuth, client: httpx.AsyncClient) -> bool:
     """Check if account is already referred by querying points."""
     url = "https://api.standx.com/v1/offchain/perps-campaign/points"
-    headers = {"Authorization": f"Bearer {auth.token}", "Accept": "application/json"}
-    
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, headers=headers)
-        if response.status_code == 200:
-            data = response.json()
-            refer_at = data.get("refer_at")
-            if refer_at:
-                return True
+    response = await client.get(url, headers=auth.bearer_headers)
+    if response.status_code == 200:
+        data = response.json()
+        refer_at = data.get("refer_at")
+        if refer_at:
+            return True
     return False
 
 
-async def apply_referral(auth: StandXAuth, referral_code: str) -> dict:
+async def apply_referral(auth: StandXAuth, referral_code: str, client: httpx.AsyncClient) -> dict:
     """Apply referral code to the account."""
     url = "https://api.standx.com/v1/offchain/referral"
     
@@ -52,9 +58,8 @@ async def apply_referral(auth: StandXAuth, referral_code: str) -> dict:
     body_signed = auth._signing_key.sign(body.encode())
     headers["x-body-signature"] = base64.b64encode(body_signed.signature).decode()
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(url, content=body, headers=headers)
-        return response.json()
+    response = await client.post(url, content=body, headers=headers)
+    return response.json()
 
 
 async def main(config_path: str):
@@ -67,27 +72,28 @@ async def main(config_path: str):
     await auth.authenticate(config.wallet.chain, config.wallet.private_key)
     print("Authentication successful")
     
-    # Check if already referred
-    print("Checking referral status...")
-    is_referred = await check_if_referred(auth)
+    async with create_client() as client:
+        # Check if already referred
+        print("Checking referral status...")
+        is_referred = await check_if_referred(auth, client)
     
-    if is_referred:
-        print("✓ Account is already referred. No action needed.")
-        return
+        if is_referred:
+            print("✓ Account is already referred. No action needed.")
+            return
     
-    print(f"Account is NOT referred. Applying referral code: {REFERRAL_CODE}")
+        print(f"Account is NOT referred. Applying referral code: {REFERRAL_CODE}")
     
-    try:
-        result = await apply_referral(auth, REFERRAL_CODE)
+        try:
+            result = await apply_referral(auth, REFERRAL_CODE, client)
         
-        if result.get("success") or result.get("code") == 0:
-            print(f"✓ Referral applied successfully!")
-            print(f"  Response: {result}")
-        else:
-            print(f"✗ Referral failed: {result}")
+            if result.get("success") or result.get("code") == 0:
+                print(f"✓ Referral applied successfully!")
+                print(f"  Response: {result}")
+            else:
+                print(f"✗ Referral failed: {result}")
             
-    except Exception as e:
-        print(f"✗ Error applying referral: {e}")
+        except Exception as e:
+            print(f"✗ Error applying referral: {e}")
 
 
 def parse_args():